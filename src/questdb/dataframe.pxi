@@ -2188,7 +2188,8 @@ cdef void_int _dataframe_serialize_cell(
 
 cdef void _dataframe_col_advance(col_t* col) noexcept nogil:
     # Branchless version of:
-    #     cdef bint new_chunk = cursor.offset == <size_t>cursor.chunk.length
+    #     cdef bint new_chunk = cursor.offset == <size_t>(
+    #         cursor.chunk.offset + cursor.chunk.length)
     #     if new_chunk == 0:
     #         cursor.chunk_index += 1
     #         cursor.chunk += 1  # pointer advance
@@ -2202,7 +2203,8 @@ cdef void _dataframe_col_advance(col_t* col) noexcept nogil:
     cdef col_cursor_t* cursor = &col.cursor
     cdef size_t new_chunk  # disguised bint. Either 0 or 1.
     cursor.offset += 1
-    new_chunk = cursor.offset == <size_t>cursor.chunk.length
+    new_chunk = cursor.offset == <size_t>(
+        cursor.chunk.offset + cursor.chunk.length)
     cursor.chunk_index += new_chunk
     cursor.chunk += new_chunk
     # Note: We get away with this because we've allocated one extra blank chunk.
@@ -2248,6 +2250,92 @@ cdef void_int _dataframe_handle_auto_flush(
         raise c_err_to_py(marker_err)
 
 
+cdef size_t _dataframe_arrow_str_size(
+        col_t* col, size_t cell_overhead) noexcept nogil:
+    """
+    Size of an Arrow str column across all its chunks: The UTF-8 bytes
+    spanned by its offsets (null cells included), plus `cell_overhead`
+    for each non-null cell (when the null count is known).
+    """
+    cdef size_t total = 0
+    cdef size_t chunk_index
+    cdef ArrowArray* chunk
+    cdef int32_t* offsets
+    cdef int64_t* lrg_offsets
+    for chunk_index in range(col.setup.chunks.n_chunks):
+        chunk = &col.setup.chunks.chunks[chunk_index]
+        if chunk.length == 0:
+            continue
+        if col.setup.source == col_source_t.col_source_str_utf8_arrow:
+            offsets = <int32_t*>chunk.buffers[1]
+            total += <size_t>(
+                offsets[chunk.offset + chunk.length] - offsets[chunk.offset])
+        else:
+            lrg_offsets = <int64_t*>chunk.buffers[1]
+            total += <size_t>(
+                lrg_offsets[chunk.offset + chunk.length] -
+                lrg_offsets[chunk.offset])
+        if chunk.null_count >= 0:  # -1 if unknown.
+            total += <size_t>(chunk.length - chunk.null_count) * cell_overhead
+    return total
+
+
+cdef size_t _dataframe_estimate_size(
+        col_t_arr* cols,
+        line_sender_table_name* c_table_name,
+        int64_t at_value,
+        size_t row_count) noexcept nogil:
+    """
+    Estimate the number of bytes `_dataframe` will append to the buffer.
+
+    This is so we can reserve the buffer once, rather than have it grow
+    (and copy) repeatedly during serialization.
+
+    The estimate is meant to be a lower bound: The buffer keeps its capacity
+    after `clear()`, so reserving more than the output needs would stick
+    around. Arrow string columns are measured from the offsets span of each
+    chunk. Arrow allows null cells to cover bytes in that span, so those
+    could be over-counted, but null cells normally span none. Numpy bool, int
+    and float columns can't be null, so each cell counts its name,
+    separators and the shortest value it could format to. Everything else
+    (Python objects, categoricals, other Arrow columns, datetimes with NaTs)
+    counts for nothing and grows the buffer as before.
+    """
+    cdef size_t row_size = 1  # Trailing newline.
+    cdef size_t extra = 0
+    cdef size_t col_index
+    cdef col_t* col
+    cdef col_source_t source
+    cdef col_target_t target
+    if c_table_name.buf != NULL:
+        row_size += c_table_name.len
+    if at_value >= 0:
+        row_size += 2  # Separator and at least one digit.
+    for col_index in range(cols.size):
+        col = &cols.d[col_index]
+        source = col.setup.source
+        target = col.setup.target
+        if (source == col_source_t.col_source_str_utf8_arrow or
+                source == col_source_t.col_source_str_lrg_utf8_arrow):
+            if target == col_target_t.col_target_symbol:
+                extra += _dataframe_arrow_str_size(
+                    col, col.name.len + 2)  # Separator and `=`.
+            elif target == col_target_t.col_target_column_str:
+                extra += _dataframe_arrow_str_size(
+                    col, col.name.len + 4)  # Separator, `=` and quotes.
+            else:  # Table name.
+                extra += _dataframe_arrow_str_size(col, 0)
+        elif source == col_source_t.col_source_bool_numpy:
+            row_size += col.name.len + 3  # Separator, `=`, `t` or `f`.
+        elif (source == col_source_t.col_source_f32_numpy or
+                source == col_source_t.col_source_f64_numpy):
+            row_size += col.name.len + 3  # Separator, `=`, a digit.
+        elif (col_source_t.col_source_u8_numpy <= source <=
+                col_source_t.col_source_i64_numpy):
+            row_size += col.name.len + 4  # Separator, `=`, a digit, `i`.
+    return row_count * row_size + extra
+
+
 # Every how many cells to release and re-acquire the Python GIL.
 #
 # We've done some perf testing with some mixed column dtypes.
@@ -2279,6 +2367,7 @@ cdef void_int _dataframe(
     cdef size_t col_index
     cdef col_t* col
     cdef size_t row_gil_blip_interval
+    cdef size_t row_gil_blip_countdown = 0
     cdef PyThreadState* gs = NULL  # GIL state. NULL means we have the GIL.
     cdef bint had_gil
     cdef bint was_serializing_cell = False
@@ -2316,6 +2405,14 @@ cdef void_int _dataframe(
         if not line_sender_buffer_set_marker(ls_buf, &err):
             raise c_err_to_py(err)
 
+        # With auto-flushing the buffer is drained as we go:
+        # Reserving for the whole dataframe would just waste memory.
+        if not af.mode.enabled:
+            line_sender_buffer_reserve(
+                ls_buf,
+                _dataframe_estimate_size(
+                    &cols, &c_table_name, at_value, row_count))
+
         row_gil_blip_interval = _CELL_GIL_BLIP_INTERVAL // col_count
         if row_gil_blip_interval < 400:  # ceiling reached at 100 columns
             row_gil_blip_interval = 400
@@ -2327,13 +2424,17 @@ cdef void_int _dataframe(
                 _ensure_doesnt_have_gil(&gs)
 
             for row_index in range(row_count):
-                if (gs == NULL) and (row_index % row_gil_blip_interval == 0):
+                if gs == NULL:
                     # Release and re-acquire the GIL every so often.
                     # This is to allow other python threads to run.
                     # If we hold the GIL for too long, we can starve other
                     # threads, for example timing out network activity.
-                    _ensure_doesnt_have_gil(&gs)
-                    _ensure_has_gil(&gs)
+                    # Counting down is cheaper than `row_index % interval`.
+                    if row_gil_blip_countdown == 0:
+                        row_gil_blip_countdown = row_gil_blip_interval
+                        _ensure_doesnt_have_gil(&gs)
+                        _ensure_has_gil(&gs)
+                    row_gil_blip_countdown -= 1
 
                 qdb_pystr_buf_truncate(b, str_buf_marker)
 
@@ -2,12 +2,16 @@
 
 import sys
 import os
+import re
 sys.dont_write_bytecode = True
 import unittest
 import datetime as dt
 import functools
+import itertools
 import tempfile
+import shutil
 import pathlib
+import threading
 
 BROKEN_TIMEZONES = True
 
@@ -32,18 +36,12 @@ except ImportError:
     fastparquet = None
 
 
-def _dataframe(*args, **kwargs):
-    buf = qi.Buffer()
-    buf.dataframe(*args, **kwargs)
-    return str(buf)
-
 DF1 = pd.DataFrame({
     'A': [1.0, 2.0, 3.0],
     'B': [1, 2, 3],
-    'C': [
-        pd.Timestamp('20180310'),
-        pd.Timestamp('20180311'),
-        pd.Timestamp('20180312')],
+    'C': np.array(
+        ['2018-03-10', '2018-03-11', '2018-03-12'],
+        dtype='datetime64[ns]'),
     'D': [True, 'foo', 'bar']})
 
 
@@ -55,197 +53,642 @@ DF2 = pd.DataFrame({
     'D': pd.Series(['a1', 'a2', 'a3'], dtype='string'),
     'E': [1.0, 2.0, 3.0],
     'F': [1, 2, 3],
-    'G': [
-        pd.Timestamp('20180310'),
-        pd.Timestamp('20180311'),
-        pd.Timestamp('20180312')]})
+    'G': np.array(
+        ['2018-03-10', '2018-03-11', '2018-03-12'],
+        dtype='datetime64[ns]')})
+
+
+# Error patterns shared by several tests, compiled once.
+_RE_NEEDS_AT = re.compile("needs keyword-only argument at")
+_RE_BAD_TABLE_NAME_COL_DTYPE = re.compile('`table_name_col`: Bad dtype')
+_RE_BAD_TABLE_NAME_COL_OBJ = re.compile("`table_name_col`: Bad.*`object`.*bool.*'D'.*Must.*strings")
+_RE_BAD_SYMBOLS = re.compile('`symbols`.*bool.*tuple.*list')
+_RE_U64_OVERFLOW = re.compile('.* serialize .* column .a. .* 4 .*9223372036854775808.*int64.*')
+_RE_TOO_LONG = re.compile("Too long")
+_RE_NULL_TABLE_NAME = re.compile('Failed.*Expected a table name, got a null.*')
+_RE_EMPTY_TABLE_NAME = re.compile("''.*must have a non-zero length")
+_RE_BAD_DOT = re.compile("'tab..1'.*invalid dot `\\.` at position 4")
+
+
+# Bad `DF1` arguments and the errors they raise: `(kwargs, pattern)`.
+_INVALID_COLUMN_DTYPE_CASES = [
+    ({'table_name_col': 'B', 'at': qi.ServerTimestamp},
+        _RE_BAD_TABLE_NAME_COL_DTYPE),
+    ({'table_name_col': 1, 'at': qi.ServerTimestamp},
+        _RE_BAD_TABLE_NAME_COL_DTYPE),
+    ({'table_name_col': -3, 'at': qi.ServerTimestamp},
+        _RE_BAD_TABLE_NAME_COL_DTYPE),
+    ({'table_name_col': -5, 'at': qi.ServerTimestamp},
+        '`table_name_col`: -5 index')]
+
+_BAD_STR_OBJ_COL_CASES = [
+    ({'table_name_col': 'D', 'at': qi.ServerTimestamp},
+        _RE_BAD_TABLE_NAME_COL_OBJ),
+    ({'table_name_col': 3, 'at': qi.ServerTimestamp},
+        _RE_BAD_TABLE_NAME_COL_OBJ),
+    ({'table_name_col': -1, 'at': qi.ServerTimestamp},
+        _RE_BAD_TABLE_NAME_COL_OBJ)]
+
+_BAD_SYMBOL_CASES = [
+    ({'table_name': 'tbl1', 'symbols': 0, 'at': qi.ServerTimestamp},
+        _RE_BAD_SYMBOLS),
+    ({'table_name': 'tbl1', 'symbols': {}, 'at': qi.ServerTimestamp},
+        _RE_BAD_SYMBOLS),
+    ({'table_name': 'tbl1', 'symbols': None, 'at': qi.ServerTimestamp},
+        _RE_BAD_SYMBOLS),
+    ({'table_name': 'tbl1', 'symbols': (0,), 'at': qi.ServerTimestamp},
+        "`symbols`: Bad dtype `float64`.*'A'.*Must.*strings col"),
+    ({'table_name': 'tbl1', 'symbols': [1], 'at': qi.ServerTimestamp},
+        "`symbols`: Bad dtype `int64`.*'B'.*Must be a strings column.")]
+
+_BAD_AT_CASES = [
+    ({'table_name': 'tbl1', 'at': '2018-03-10T00:00:00Z'},
+        '`at`.*2018.*not found in the'),
+    ({'table_name': 'tbl1', 'at': 'A'},
+        '`at`.*float64.*be a datetime'),
+    ({'table_name': 'tbl1', 'at': 1},
+        '`at`.*int64.*be a datetime'),
+    ({'table_name': 'tbl1', 'at': -1},
+        '`at`.*object.*be a datetime')]
+
+
+# Serialization output buffer, shared by all tests running on a thread.
+# `clear()` keeps the capacity, so it only grows for the few big tests.
+# A buffer that grew past `_SHARED_BUF_MAX_CAPACITY` is dropped and
+# replaced by a fresh one rather than kept around for the whole run.
+_SHARED_BUF = threading.local()
+_SHARED_BUF_INIT_CAPACITY = 64 * 1024
+_SHARED_BUF_MAX_CAPACITY = 16 * 1024 * 1024
+
+
+def _shared_buffer():
+    buf = getattr(_SHARED_BUF, 'buf', None)
+    if buf is None or buf.capacity() > _SHARED_BUF_MAX_CAPACITY:
+        buf = qi.Buffer(init_buf_size=_SHARED_BUF_INIT_CAPACITY)
+        _SHARED_BUF.buf = buf
+    buf.clear()
+    return buf
+
+
+# Tests set the index name of this one (it's used as the table name).
+# `TestPandas.tearDown` resets it.
+_NAMED_DF = pd.DataFrame({
+    'a': [1, 2, 3],
+    'b': ['a', 'b', 'c']})
+
+
+# Fixture dataframes shared across tests.
+# Building a dataframe is much more expensive than serializing a few rows of it,
+# so each fixture is built once on first use and then reused.
+# `Buffer.dataframe()` never mutates its input: Don't mutate these either.
+_fixture = functools.lru_cache(maxsize=None)
+
+
+# Integer column test cases: `(dtype, values)`, including each type's limits.
+_INT_NUMPY_CASES = [
+    ('uint8', (1, 2, 3, 0, 255)),
+    ('int8', (1, 2, 3, -128, 127, 0)),
+    ('uint16', (1, 2, 3, 0, 65535)),
+    ('int16', (1, 2, 3, -32768, 32767, 0)),
+    ('uint32', (1, 2, 3, 0, 4294967295)),
+    ('int32', (1, 2, 3, -2147483648, 0, 2147483647)),
+    ('uint64', (1, 2, 3, 0, 9223372036854775807)),  # i64 max, see overflow test.
+    ('int64', (1, 2, 3, -9223372036854775808, 0, 9223372036854775807))]
+
+_INT_ARROW_CASES = [
+    ('UInt8', (1, 2, 3, 0, None, 255)),
+    ('Int8', (1, 2, 3, -128, 0, None, 127)),
+    ('UInt16', (1, 2, 3, 0, None, 65535)),
+    ('Int16', (1, 2, 3, -32768, 0, None, 32767)),
+    ('UInt32', (1, 2, 3, 0, None, 4294967295)),
+    ('Int32', (1, 2, 3, -2147483648, 0, None, 2147483647)),
+    ('UInt64', (1, 2, 3, 0, None, 9223372036854775807)),
+    ('Int64', (1, 2, 3, -9223372036854775808, 0, None, 9223372036854775807))]
+
+
+@_fixture
+def _df_int_numpy(dtype, vals):
+    return pd.DataFrame({'a': np.array(vals, dtype=dtype)})
+
+
+@_fixture
+def _df_int_arrow(dtype, vals):
+    # Build the column with pyarrow's vectorized builder and convert it
+    # to the matching pandas nullable dtype: Much cheaper than having
+    # `pd.Series(vals, dtype=dtype)` infer the mask value by value.
+    arrow_type = pa.type_for_alias(dtype.lower())
+    col = pa.array(vals, type=arrow_type).to_pandas(
+        types_mapper={arrow_type: pd.api.types.pandas_dtype(dtype)}.get)
+    return pd.DataFrame({
+        'a': col,
+        'b': [chr(ord('a') + i) for i in range(len(vals))]})
+
+
+# Float column values shared by both dtypes, before each type's max.
+_FLOAT_VALS = (
+    1.0, 2.0, 3.0, 0.0,
+    float('inf'), float('-inf'), float('nan'))
+
+# Float column test cases: `(dtype, max value, max value as serialized)`.
+_FLOAT_CASES = [
+    ('float32', 3.4028234663852886e38, '3.4028234663852886e38'),
+    ('float64', 1.7976931348623157e308, '1.7976931348623157e308')]
+
+_EXP_FLOAT_NUMPY = (
+    'tbl1 a=1.0\n'
+    'tbl1 a=2.0\n'
+    'tbl1 a=3.0\n'
+    'tbl1 a=0.0\n'
+    'tbl1 a=Infinity\n'
+    'tbl1 a=-Infinity\n'
+    'tbl1 a=NaN\n')
+
+_EXP_FLOAT_ARROW = (
+    'tbl1 a=1.0,b="a"\n'
+    'tbl1 a=2.0,b="b"\n'
+    'tbl1 a=3.0,b="c"\n'
+    'tbl1 a=0.0,b="d"\n'
+    'tbl1 a=Infinity,b="e"\n'
+    'tbl1 a=-Infinity,b="f"\n'
+    'tbl1 b="g"\n')  # This one is wierd: `nan` gets 0 in the bitmask.
+
+
+@_fixture
+def _df_float_numpy(dtype, vals):
+    return pd.DataFrame({'a': np.array(vals, dtype=dtype)})
+
+
+@_fixture
+def _df_float_arrow(dtype, vals):
+    return pd.DataFrame({
+        'a': pd.Series(vals, dtype=dtype),
+        'b': [chr(ord('a') + i) for i in range(len(vals))]})
+
+
+_BOOL_VALUES = np.array([
+    True, False, False,
+    False, True, False], dtype=np.bool_)
+
+
+@_fixture
+def _df_bool_numpy():
+    return pd.DataFrame({'a': _BOOL_VALUES})
+
+
+@_fixture
+def _df_bool_arrow():
+    values = pa.array([
+            True, False, False,
+            False, True, False,
+            True, True, True,
+            False, False, False],
+        type=pa.bool_())
+    # Note `boolean` != `bool`.
+    return pd.DataFrame({'a': values.to_pandas(
+        types_mapper={pa.bool_(): pd.BooleanDtype()}.get)})
+
+
+@_fixture
+def _df_bool_obj():
+    return pd.DataFrame({'a': _BOOL_VALUES.astype(object)})
+
+
+def _datetime64_ns_with_nulls():
+    """Six consecutive seconds from 2019-01-01, then three nulls."""
+    return np.concatenate([
+        pd.date_range('2019-01-01', periods=6, freq='s').to_numpy(),
+        np.full(3, 'NaT', dtype='datetime64[ns]')])
+
+
+@_fixture
+def _df_datetime64_numpy():
+    return pd.DataFrame({
+        'a': _datetime64_ns_with_nulls(),
+        'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']})
+
+
+@_fixture
+def _df_datetime64_numpy_epoch():
+    return pd.DataFrame({'a': np.array([
+            '1970-01-01T00:00:00',
+            '1970-01-01T00:00:01',
+            '1970-01-01T00:00:02'],
+        dtype='datetime64[ns]')})
+
+
+def _tz_datetimes(*values):
+    """Localize naive ISO datetime strings to `_TZ`, all in one call."""
+    return pd.DatetimeIndex(
+        np.array(values, dtype='datetime64[ns]')).tz_localize(_TZ)
+
+
+@_fixture
+def _df_datetime64_tz(*values):
+    """
+    Column `a` of `_tz_datetimes(*values)` and a symbol column `b`.
+    Cached, so the timezone localization runs once per set of values.
+    """
+    return pd.DataFrame({
+        'a': _tz_datetimes(*values),
+        'b': [f'sym{index}' for index in range(1, len(values) + 1)]})
+
+
+@_fixture
+def _df_datetime64_tz_arrow():
+    # 2019-01-01 00:00:00, :01, null, :03 in `_TZ`, as UTC epoch nanos.
+    # The timezone is attached once, to the whole arrow array.
+    a = pa.array(
+        [1546318800000000000, 1546318801000000000, None, 1546318803000000000],
+        type=pa.timestamp('ns', tz=str(_TZ))).to_pandas()
+    return pd.DataFrame({
+        'a': a,
+        'b': ['sym1', 'sym2', 'sym3', 'sym4']})
+
+
+# Shared string values for the fixtures and their expected output.
+_LONG_STR = '❤️' * 1200
+_MAX_TABLE_NAME = 'b' * 127
+_TOO_LONG_TABLE_NAME = 'b' * 128
+
+
+@_fixture
+def _df_str_numpy():
+    return pd.DataFrame({'a': pd.Series([
+            'a',                     # ASCII
+            'q❤️p',                   # Mixed ASCII and UCS-2
+            _LONG_STR,                # Over the 1024 buffer prealloc.
+            'Questo è un qualcosa',  # Non-ASCII UCS-1
+            'щось',                  # UCS-2, 2 bytes for UTF-8.
+            '',                      # Empty string
+            '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
+            '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
+        dtype='str')})
+
+
+@_fixture
+def _df_str_arrow():
+    return pd.DataFrame({
+        'a': pd.Series([
+            'a',                     # ASCII
+            'q❤️p',                   # Mixed ASCII and UCS-2
+            _LONG_STR,                # Over the 1024 buffer prealloc.
+            'Questo è un qualcosa',  # Non-ASCII UCS-1
+            'щось',                  # UCS-2, 2 bytes for UTF-8.
+            '',                      # Empty string
+            None,
+            '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
+            '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
+            dtype='string[pyarrow]'),
+        'b': [1, 2, 3, 4, 5, 6, 7, 8, 9]})
+
+
+# Category counts for int8, int16 and int32 dictionary keys, incl. the limits.
+_CAT_COUNTS_I8 = (30, 127)
+_CAT_COUNTS_I16 = (128, 4000, 32767)
+_CAT_COUNTS_I32 = (32768, 40000)
+
+
+@_fixture
+def _df_cat(count, null_index=None):
+    """
+    Categorical column `a` of `count` distinct strings `s0`, `s1`, ...
+    (optionally with a null at `null_index`) and an int column `b`.
+    The category count determines the width of the dictionary keys.
+    """
+    slist = [f's{i}' for i in range(count)]
+    if null_index is not None:
+        slist[null_index] = None
+    return pd.DataFrame({
+        'a': pd.Series(slist, dtype='category'),
+        'b': list(range(count))})
+
+
+# Expected serialized output for the fixtures above.
+
+# `_BOOL_VALUES`, both as a numpy `bool` and as an `object` column.
+_EXP_BOOL_VALUES = (
+    'tbl1 a=t\n'
+    'tbl1 a=f\n'
+    'tbl1 a=f\n'
+    'tbl1 a=f\n'
+    'tbl1 a=t\n'
+    'tbl1 a=f\n')
+
+_EXP_BOOL_ARROW = (
+    'tbl1 a=t\n'
+    'tbl1 a=f\n'
+    'tbl1 a=f\n'
+    'tbl1 a=f\n'
+    'tbl1 a=t\n'
+    'tbl1 a=f\n'
+    'tbl1 a=t\n'
+    'tbl1 a=t\n'
+    'tbl1 a=t\n'
+    'tbl1 a=f\n'
+    'tbl1 a=f\n'
+    'tbl1 a=f\n')
+
+_EXP_DATETIME64_NUMPY = (
+    'tbl1 a=1546300800000000t,b="a"\n'
+    'tbl1 a=1546300801000000t,b="b"\n'
+    'tbl1 a=1546300802000000t,b="c"\n'
+    'tbl1 a=1546300803000000t,b="d"\n'
+    'tbl1 a=1546300804000000t,b="e"\n'
+    'tbl1 a=1546300805000000t,b="f"\n'
+    'tbl1 b="g"\n'
+    'tbl1 b="h"\n'
+    'tbl1 b="i"\n')
+
+_EXP_STR_NUMPY_SYMBOL = (
+    'tbl1,a=a\n'
+    'tbl1,a=q❤️p\n'
+    f"tbl1,a={_LONG_STR}\n"
+    'tbl1,a=Questo\\ è\\ un\\ qualcosa\n'
+    'tbl1,a=щось\n'
+    'tbl1,a=\n'
+    'tbl1,a=嚜꓂\n'
+    'tbl1,a=💩🦞\n')
+
+_EXP_STR_NUMPY_COL = (
+    'tbl1 a="a"\n'
+    'tbl1 a="q❤️p"\n'
+    f'tbl1 a="{_LONG_STR}"\n'
+    'tbl1 a="Questo è un qualcosa"\n'
+    'tbl1 a="щось"\n'
+    'tbl1 a=""\n'
+    'tbl1 a="嚜꓂"\n'
+    'tbl1 a="💩🦞"\n')
+
+_EXP_STR_ARROW_SYMBOL = (
+    'tbl1,a=a b=1i\n'
+    'tbl1,a=q❤️p b=2i\n'
+    f"tbl1,a={_LONG_STR} b=3i\n"
+    'tbl1,a=Questo\\ è\\ un\\ qualcosa b=4i\n'
+    'tbl1,a=щось b=5i\n'
+    'tbl1,a= b=6i\n'
+    'tbl1 b=7i\n'
+    'tbl1,a=嚜꓂ b=8i\n'
+    'tbl1,a=💩🦞 b=9i\n')
+
+_EXP_STR_ARROW_COL = (
+    'tbl1 a="a",b=1i\n'
+    'tbl1 a="q❤️p",b=2i\n'
+    f'tbl1 a="{_LONG_STR}",b=3i\n'
+    'tbl1 a="Questo è un qualcosa",b=4i\n'
+    'tbl1 a="щось",b=5i\n'
+    'tbl1 a="",b=6i\n'
+    'tbl1 b=7i\n'
+    'tbl1 a="嚜꓂",b=8i\n'
+    'tbl1 a="💩🦞",b=9i\n')
 
 
 def with_tmp_dir(func):
+    """
+    Pass a fresh, empty directory to the test.
+    It's a subdirectory of the class-wide `cls._tmp_root`.
+    """
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        with tempfile.TemporaryDirectory(prefix='py-questdb-client_') as tmpdir:
-            return func(self, *args, pathlib.Path(tmpdir), **kwargs)
+        tmpdir = self._tmp_root / f'{func.__name__}_{next(self._tmp_counter)}'
+        tmpdir.mkdir()
+        return func(self, *args, tmpdir, **kwargs)
     return wrapper
 
 
+def _same_instant_timestamps(utc, local_tz, nanos):
+    """
+    `at` values all denoting one instant: Given as a UTC datetime, the same
+    datetime in `_TZ` and its nanos since the epoch.
+    """
+    naive_local = utc.astimezone(tz=None).replace(tzinfo=None)
+    datetimes = [naive_local, utc, local_tz]
+    return (
+        datetimes +
+        [qi.TimestampNanos(nanos)] +
+        [qi.TimestampNanos.from_datetime(t) for t in datetimes])
+
+
 class TestPandas(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One scratch directory for the whole class, see `with_tmp_dir`.
+        cls._tmp_root = pathlib.Path(
+            tempfile.mkdtemp(prefix='py-questdb-client_'))
+        cls._tmp_counter = itertools.count()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmp_root, ignore_errors=True)
+
+    def setUp(self):
+        # Cleared again before each serialization.
+        self.buf = _shared_buffer()
+
+    def tearDown(self):
+        _NAMED_DF.index.name = None
+
+    def _df(self, *args, **kwargs):
+        self.buf.clear()
+        self.buf.dataframe(*args, **kwargs)
+        return str(self.buf)
+
+    def _df_len(self, *args, **kwargs):
+        """Serialize, returning only the output length: No string copy."""
+        self.buf.clear()
+        self.buf.dataframe(*args, **kwargs)
+        return len(self.buf)
+
     def test_mandatory_at_dataframe(self):
-        with self.assertRaisesRegex(TypeError, "needs keyword-only argument at"):
-            _dataframe([])
-        with self.assertRaisesRegex(TypeError, "needs keyword-only argument at"):
-            buf = qi.Buffer()
+        with self.assertRaisesRegex(TypeError, _RE_NEEDS_AT):
+            self._df([])
+        with self.assertRaisesRegex(TypeError, _RE_NEEDS_AT):
+            buf = self.buf
             buf.dataframe([])
 
-        buf = qi.Buffer()
+        buf = self.buf
         buf.dataframe(pd.DataFrame(), at=qi.ServerTimestamp)
 
     def test_mandatory_at_row(self):
-        with self.assertRaisesRegex(TypeError, "needs keyword-only argument at"):
-            buf = qi.Buffer()
+        with self.assertRaisesRegex(TypeError, _RE_NEEDS_AT):
+            buf = self.buf
             buf.row(table_name="test_buffer")
 
-        buf = qi.Buffer()
+        buf = self.buf
         buf.row(table_name="test_mandatory_at_row", at=qi.ServerTimestamp)
 
     def test_bad_dataframe(self):
         with self.assertRaisesRegex(qi.IngressError,
                 'Expected pandas'):
-            _dataframe([], at=qi.ServerTimestamp)
+            self._df([], at=qi.ServerTimestamp)
 
     def test_no_table_name(self):
         with self.assertRaisesRegex(qi.IngressError,
                 'Must specify at least one of'):
-            _dataframe(DF1, at=qi.ServerTimestamp)
+            self._df(DF1, at=qi.ServerTimestamp)
 
     def test_bad_table_name_type(self):
         with self.assertRaisesRegex(TypeError, "'table_name' has incorrect type"):
-            _dataframe(DF1, table_name=1.5, at=qi.ServerTimestamp)
+            self._df(DF1, table_name=1.5, at=qi.ServerTimestamp)
 
     def test_invalid_table_name(self):
         with self.assertRaisesRegex(qi.IngressError,
                 '`table_name`: Bad string "."'):
-            _dataframe(DF1, table_name='.', at=qi.ServerTimestamp)
+            self._df(DF1, table_name='.', at=qi.ServerTimestamp)
+
+    def _assert_df1_errors(self, cases):
+        for kwargs, pattern in cases:
+            with self.subTest(**kwargs), \
+                    self.assertRaisesRegex(qi.IngressError, pattern):
+                self._df(DF1, **kwargs)
 
     def test_invalid_column_dtype(self):
-        with self.assertRaisesRegex(qi.IngressError,
-                '`table_name_col`: Bad dtype'):
-            _dataframe(DF1, table_name_col='B', at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                '`table_name_col`: Bad dtype'):
-            _dataframe(DF1, table_name_col=1, at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                '`table_name_col`: Bad dtype'):
-            _dataframe(DF1, table_name_col=-3, at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                '`table_name_col`: -5 index'):
-            _dataframe(DF1, table_name_col=-5, at=qi.ServerTimestamp)
+        self._assert_df1_errors(_INVALID_COLUMN_DTYPE_CASES)
 
     def test_bad_str_obj_col(self):
-        with self.assertRaisesRegex(qi.IngressError,
-                "`table_name_col`: Bad.*`object`.*bool.*'D'.*Must.*strings"):
-            _dataframe(DF1, table_name_col='D', at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                "`table_name_col`: Bad.*`object`.*bool.*'D'.*Must.*strings"):
-            _dataframe(DF1, table_name_col=3, at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                "`table_name_col`: Bad.*`object`.*bool.*'D'.*Must.*strings"):
-            _dataframe(DF1, table_name_col=-1, at=qi.ServerTimestamp)
+        self._assert_df1_errors(_BAD_STR_OBJ_COL_CASES)
 
     def test_bad_symbol(self):
-        with self.assertRaisesRegex(qi.IngressError,
-                '`symbols`.*bool.*tuple.*list'):
-            _dataframe(DF1, table_name='tbl1', symbols=0, at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                '`symbols`.*bool.*tuple.*list'):
-            _dataframe(DF1, table_name='tbl1', symbols={}, at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                '`symbols`.*bool.*tuple.*list'):
-            _dataframe(DF1, table_name='tbl1', symbols=None, at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                "`symbols`: Bad dtype `float64`.*'A'.*Must.*strings col"):
-            _dataframe(DF1, table_name='tbl1', symbols=(0,), at=qi.ServerTimestamp)
-        with self.assertRaisesRegex(qi.IngressError,
-                "`symbols`: Bad dtype `int64`.*'B'.*Must be a strings column."):
-            _dataframe(DF1, table_name='tbl1', symbols=[1], at=qi.ServerTimestamp)
+        self._assert_df1_errors(_BAD_SYMBOL_CASES)
 
     def test_bad_at(self):
-        with self.assertRaisesRegex(qi.IngressError,
-                '`at`.*2018.*not found in the'):
-            _dataframe(DF1, table_name='tbl1', at='2018-03-10T00:00:00Z')
-        with self.assertRaisesRegex(qi.IngressError,
-                '`at`.*float64.*be a datetime'):
-            _dataframe(DF1, table_name='tbl1', at='A')
-        with self.assertRaisesRegex(qi.IngressError,
-                '`at`.*int64.*be a datetime'):
-            _dataframe(DF1, table_name='tbl1', at=1)
-        with self.assertRaisesRegex(qi.IngressError,
-                '`at`.*object.*be a datetime'):
-            _dataframe(DF1, table_name='tbl1', at=-1)
+        self._assert_df1_errors(_BAD_AT_CASES)
 
     def test_empty_dataframe(self):
-        buf = _dataframe(pd.DataFrame(), table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(buf, '')
+        self.assertEqual(
+            self._df_len(
+                pd.DataFrame(), table_name='tbl1', at=qi.ServerTimestamp),
+            0)
 
     def test_zero_row_dataframe(self):
-        buf = _dataframe(pd.DataFrame(columns=['A', 'B']), table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(buf, '')
+        self.assertEqual(
+            self._df_len(
+                pd.DataFrame(columns=['A', 'B']),
+                table_name='tbl1',
+                at=qi.ServerTimestamp),
+            0)
 
     def test_zero_column_dataframe(self):
         df = pd.DataFrame(index=[0, 1, 2])
         self.assertEqual(len(df), 3)
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(buf, '')
+        self.assertEqual(
+            self._df_len(df, table_name='tbl1', at=qi.ServerTimestamp), 0)
+
+    def test_reserve_output_unchanged(self):
+        # The buffer is reserved up front: The output must match `row()`.
+        strs = ['x', 'y❤️', 'z' * 1000]
+        ints = [1, -2, 2**63 - 1]
+        floats = [1.5, -2.5, 1e300]
+        bools = [True, False, True]
+        df = pd.DataFrame({
+            'a': pd.Series(strs, dtype='string[pyarrow]'),
+            'b': ints,
+            'c': floats,
+            'd': bools})
+        exp = qi.Buffer()
+        for a, b, c, d in zip(strs, ints, floats, bools):
+            exp.row(
+                'tbl1',
+                symbols={'a': a},
+                columns={'b': b, 'c': c, 'd': d},
+                at=qi.ServerTimestamp)
+        buf = qi.Buffer(init_buf_size=0)
+        buf.dataframe(df, table_name='tbl1', symbols=['a'], at=qi.ServerTimestamp)
+        self.assertEqual(str(buf), str(exp))
+
+    def test_reserve_lower_bound(self):
+        # The estimate never exceeds the output, so a buffer that can
+        # already hold the output is never grown by the reserve.
+        # Ints, bools and arrow strings are estimated exactly here.
+        cases = [
+            ('numpy', pd.DataFrame({
+                'a': np.zeros(100, dtype='int8'),
+                'b': np.ones(100, dtype='bool')}),
+             {'table_name': 'tbl1'}),
+            ('arrow_str', pd.DataFrame({
+                'a': pd.Series(
+                    ['a', 'q❤️p', '💩🦞' * 100, '', 'Questo è un qualcosa'],
+                    dtype='string[pyarrow]')}),
+             {'table_name': 't', 'symbols': False}),
+            ('mixed', pd.DataFrame({
+                'a': np.full(1000, -128, dtype='int8'),
+                'b': np.full(1000, 2**63 - 1, dtype='int64'),
+                'c': np.full(1000, 0.1),
+                'd': pd.Series(
+                    ['x❤️'] * 999 + [None], dtype='string[pyarrow]'),
+                'e': pd.Series(range(1000), dtype='Int64'),
+                'f': pd.Categorical(['p', 'q'] * 500),
+                'g': ['y'] * 1000}),
+             {'table_name': 'tbl1', 'symbols': ['f']})]
+        for name, df, kwargs in cases:
+            with self.subTest(name):
+                exp = qi.Buffer()
+                exp.dataframe(df, at=qi.ServerTimestamp, **kwargs)
+                buf = qi.Buffer(init_buf_size=len(exp))
+                capacity = buf.capacity()
+                buf.dataframe(df, at=qi.ServerTimestamp, **kwargs)
+                self.assertEqual(str(buf), str(exp))
+                self.assertEqual(buf.capacity(), capacity)
 
     def test_basic(self):
-        buf = _dataframe(
+        buf = self._df(
             DF2,
             table_name_col='T',
             symbols=['A', 'B', 'C', 'D'],
             at=-1)
         self.assertEqual(
             buf,
-            't1,A=a1,B=b1,C=b1,D=a1 E=1.0,F=1i 1520640000000000000\n' +
-            't2,A=a2,D=a2 E=2.0,F=2i 1520726400000000000\n' +
+            't1,A=a1,B=b1,C=b1,D=a1 E=1.0,F=1i 1520640000000000000\n'
+            't2,A=a2,D=a2 E=2.0,F=2i 1520726400000000000\n'
             't1,A=a3,B=b3,C=b3,D=a3 E=3.0,F=3i 1520812800000000000\n')
 
     def test_named_dataframe(self):
-        df = pd.DataFrame({
-            'a': [1, 2, 3],
-            'b': ['a', 'b', 'c']})
+        df = _NAMED_DF
         df.index.name = 'table_name'
-        buf = _dataframe(df, at=qi.ServerTimestamp)
+        buf = self._df(df, at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'table_name a=1i,b="a"\n' +
-            'table_name a=2i,b="b"\n' +
+            'table_name a=1i,b="a"\n'
+            'table_name a=2i,b="b"\n'
             'table_name a=3i,b="c"\n')
 
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
+            'tbl1 a=1i,b="a"\n'
+            'tbl1 a=2i,b="b"\n'
             'tbl1 a=3i,b="c"\n')
 
-        buf = _dataframe(df, table_name_col='b', at=qi.ServerTimestamp)
+        buf = self._df(df, table_name_col='b', at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'a a=1i\n' +
-            'b a=2i\n' +
+            'a a=1i\n'
+            'b a=2i\n'
             'c a=3i\n')
 
         df.index.name = 42  # bad type, not str
         with self.assertRaisesRegex(qi.IngressError,
                 'Bad dataframe index name as table.*: Expected str, not.*int.'):
-            _dataframe(df, at=qi.ServerTimestamp)
+            self._df(df, at=qi.ServerTimestamp)
 
     @unittest.skipIf(BROKEN_TIMEZONES, 'requires accurate timezones')
     def test_at_good(self):
-        df = pd.DataFrame({
-            'a': [1, 2, 3],
-            'b': ['a', 'b', 'c']})
+        df = _NAMED_DF
         df.index.name = 'test_at_good'
         with self.assertRaisesRegex(qi.IngressError,
                 'Bad argument `at`: Column .2018-03.* not found .* dataframe.'):
-            _dataframe(df, at='2018-03-10T00:00:00Z')
+            self._df(df, at='2018-03-10T00:00:00Z')
 
         # Same timestamp, specified in various ways.
-        t1_setup = dt.datetime(2018, 3, 10, 0, 0, 0, tzinfo=dt.timezone.utc)
-        t1 = t1_setup.astimezone(tz=None).replace(tzinfo=None)  # naive, local
-        t2 = dt.datetime(2018, 3, 10, 0, 0, 0, tzinfo=dt.timezone.utc)
-        t3 = dt.datetime(2018, 3, 9, 19, 0, 0, tzinfo=_TZ)
-        t4 = qi.TimestampNanos(1520640000000000000)
-        t5 = qi.TimestampNanos.from_datetime(t1)
-        t6 = qi.TimestampNanos.from_datetime(t2)
-        t7 = qi.TimestampNanos.from_datetime(t3)
-        timestamps = [t1, t2, t3, t4, t5, t6, t7]
+        timestamps = _same_instant_timestamps(
+            dt.datetime(2018, 3, 10, 0, 0, 0, tzinfo=dt.timezone.utc),
+            dt.datetime(2018, 3, 9, 19, 0, 0, tzinfo=_TZ),
+            1520640000000000000)
         for ts in timestamps:
-            buf = _dataframe(df, table_name='tbl1', at=ts)
+            buf = self._df(df, table_name='tbl1', at=ts)
             self.assertEqual(
                 buf,
-                'tbl1 a=1i,b="a" 1520640000000000000\n' +
-                'tbl1 a=2i,b="b" 1520640000000000000\n' +
+                'tbl1 a=1i,b="a" 1520640000000000000\n'
+                'tbl1 a=2i,b="b" 1520640000000000000\n'
                 'tbl1 a=3i,b="c" 1520640000000000000\n')
 
     @unittest.skipIf(BROKEN_TIMEZONES, 'requires accurate timezones')
@@ -257,376 +700,95 @@ class TestPandas(unittest.TestCase):
         for ts in neg_timestamps:
             with self.assertRaisesRegex(qi.IngressError,
                     'Bad.*`at`: Cannot .* before the Unix epoch .1970-01-01.*'):
-                _dataframe(DF2, at=ts, table_name='test_at_neg')
+                self._df(DF2, at=ts, table_name='test_at_neg')
 
     @unittest.skipIf(BROKEN_TIMEZONES, 'requires accurate timezones')
     def test_at_ts_0(self):
-        df = pd.DataFrame({
-            'a': [1, 2, 3],
-            'b': ['a', 'b', 'c']})
+        df = _NAMED_DF
         df.index.name = 'test_at_ts_0'
 
         # Epoch 0, specified in various ways.
-        e1_setup = dt.datetime(1970, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)
-        e1 = e1_setup.astimezone(tz=None).replace(tzinfo=None)  # naive, local
-        e2 = dt.datetime(1970, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)
-        e3 = dt.datetime(1969, 12, 31, 19, 0, 0, tzinfo=_TZ)
-        e4 = qi.TimestampNanos(0)
-        e5 = qi.TimestampNanos.from_datetime(e1)
-        e6 = qi.TimestampNanos.from_datetime(e2)
-        e7 = qi.TimestampNanos.from_datetime(e3)
-        edge_timestamps = [e1, e2, e3, e4, e5, e6, e7]
+        edge_timestamps = _same_instant_timestamps(
+            dt.datetime(1970, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc),
+            dt.datetime(1969, 12, 31, 19, 0, 0, tzinfo=_TZ),
+            0)
 
         for ts in edge_timestamps:
-            buf = _dataframe(df, table_name='tbl1', at=ts)
+            buf = self._df(df, table_name='tbl1', at=ts)
             self.assertEqual(
                 buf,
-                'tbl1 a=1i,b="a" 0\n' +
-                'tbl1 a=2i,b="b" 0\n' +
+                'tbl1 a=1i,b="a" 0\n'
+                'tbl1 a=2i,b="b" 0\n'
                 'tbl1 a=3i,b="c" 0\n')
 
     def test_single_at_col(self):
         df = pd.DataFrame({'timestamp': pd.to_datetime(['2023-01-01'])})
         with self.assertRaisesRegex(qi.IngressError,
                 'Bad dataframe row at index 0: All values are nulls.'):
-            _dataframe(df, table_name='tbl1', at='timestamp')
+            self._df(df, table_name='tbl1', at='timestamp')
 
     def test_row_of_nulls(self):
         df = pd.DataFrame({'a': ['a1', None, 'a3']})
         with self.assertRaisesRegex(
                 qi.IngressError, 'Bad dataframe row.*1: All values are nulls.'):
-            _dataframe(df, table_name='tbl1', symbols=['a'], at=qi.ServerTimestamp)
-
-    def test_u8_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                0,
-                255],  # u8 max
-            dtype='uint8')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=0i\n' +
-            'tbl1 a=255i\n')
-
-    def test_i8_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                -128,  # i8 min
-                127,   # i8 max
-                0], dtype='int8')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=-128i\n' +
-            'tbl1 a=127i\n' +
-            'tbl1 a=0i\n')
-
-    def test_u16_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                0,
-                65535],  # u16 max
-            dtype='uint16')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=0i\n' +
-            'tbl1 a=65535i\n')
-
-    def test_i16_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                -32768,  # i16 min
-                32767,   # i16 max
-                0], dtype='int16')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=-32768i\n' +
-            'tbl1 a=32767i\n' +
-            'tbl1 a=0i\n')
-
-    def test_u32_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                0,
-                4294967295],  # u32 max
-            dtype='uint32')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=0i\n' +
-            'tbl1 a=4294967295i\n')
-
-    def test_i32_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                -2147483648,  # i32 min
-                0,
-                2147483647],  # i32 max
-            dtype='int32')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=-2147483648i\n' +
-            'tbl1 a=0i\n' +
-            'tbl1 a=2147483647i\n')
-
-    def test_u64_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                0,
-                9223372036854775807],  # i64 max
-            dtype='uint64')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=0i\n' +
-            'tbl1 a=9223372036854775807i\n')
-
-        buf = qi.Buffer()
+            self._df(df, table_name='tbl1', symbols=['a'], at=qi.ServerTimestamp)
+
+    def test_int_numpy_cols(self):
+        for dtype, vals in _INT_NUMPY_CASES:
+            with self.subTest(dtype=dtype):
+                df = _df_int_numpy(dtype, vals)
+                buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+                exp = ''.join(f'tbl1 a={v}i\n' for v in vals)
+                self.assertEqual(buf, exp)
+
+    def test_u64_numpy_col_overflow(self):
+        buf = self.buf
         buf.dataframe(pd.DataFrame({'b': [.5, 1.0, 1.5]}), table_name='tbl2', at=qi.ServerTimestamp)
         exp1 = (
-            'tbl2 b=0.5\n' +
-            'tbl2 b=1.0\n' +
+            'tbl2 b=0.5\n'
+            'tbl2 b=1.0\n'
             'tbl2 b=1.5\n')
-        self.assertEqual(
-            str(buf),
-            exp1)
-        df2 = pd.DataFrame({'a': pd.Series([
+        self.assertEqual(str(buf), exp1)
+        df2 = pd.DataFrame({'a': np.array([
                 1, 2, 3,
                 0,
                 9223372036854775808],  # i64 max + 1
             dtype='uint64')})
         with self.assertRaisesRegex(
                 qi.IngressError,
-                '.* serialize .* column .a. .* 4 .*9223372036854775808.*int64.*'):
+                _RE_U64_OVERFLOW):
             buf.dataframe(df2, table_name='tbl1', at=qi.ServerTimestamp)
 
-        self.assertEqual(
-            str(buf),
-            exp1)  # No partial write of `df2`.
-
-    def test_i64_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1, 2, 3,
-                -9223372036854775808,  # i64 min
-                0,
-                9223372036854775807],  # i64 max
-            dtype='int64')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i\n' +
-            'tbl1 a=2i\n' +
-            'tbl1 a=3i\n' +
-            'tbl1 a=-9223372036854775808i\n' +
-            'tbl1 a=0i\n' +
-            'tbl1 a=9223372036854775807i\n')
-
-    def test_f32_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1.0, 2.0, 3.0,
-                0.0,
-                float('inf'),
-                float('-inf'),
-                float('nan'),
-                3.4028234663852886e38],  # f32 max
-            dtype='float32')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1.0\n' +
-            'tbl1 a=2.0\n' +
-            'tbl1 a=3.0\n' +
-            'tbl1 a=0.0\n' +
-            'tbl1 a=Infinity\n' +
-            'tbl1 a=-Infinity\n' +
-            'tbl1 a=NaN\n' +
-            'tbl1 a=3.4028234663852886e38\n')
-
-    def test_f64_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                1.0, 2.0, 3.0,
-                0.0,
-                float('inf'),
-                float('-inf'),
-                float('nan'),
-                1.7976931348623157e308],  # f64 max
-            dtype='float64')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1.0\n' +
-            'tbl1 a=2.0\n' +
-            'tbl1 a=3.0\n' +
-            'tbl1 a=0.0\n' +
-            'tbl1 a=Infinity\n' +
-            'tbl1 a=-Infinity\n' +
-            'tbl1 a=NaN\n' +
-            'tbl1 a=1.7976931348623157e308\n')
-
-    def test_u8_arrow_col(self):
+        self.assertEqual(str(buf), exp1)  # No partial write of `df2`.
+
+    def test_int_arrow_cols(self):
+        for dtype, vals in _INT_ARROW_CASES:
+            with self.subTest(dtype=dtype):
+                df = _df_int_arrow(dtype, vals)
+                buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+                exp = ''.join(
+                    f'tbl1 b="{b}"\n' if v is None else
+                    f'tbl1 a={v}i,b="{b}"\n'
+                    for v, b in zip(vals, df['b']))
+                self.assertEqual(buf, exp)
+
+    def test_int_arrow_col_from_list(self):
+        # The fixtures above are built from pyarrow arrays:
+        # Also cover a nullable column built directly by pandas.
         df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    0,
-                    None,
-                    255],  # u8 max
-                dtype=pd.UInt8Dtype()),
+            'a': pd.Series([1, 2, 3, 0, None, 255], dtype=pd.UInt8Dtype()),
             'b': ['a', 'b', 'c', 'd', 'e', 'f']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=0i,b="d"\n' +
-            'tbl1 b="e"\n' +
+            'tbl1 a=1i,b="a"\n'
+            'tbl1 a=2i,b="b"\n'
+            'tbl1 a=3i,b="c"\n'
+            'tbl1 a=0i,b="d"\n'
+            'tbl1 b="e"\n'
             'tbl1 a=255i,b="f"\n')
 
-    def test_i8_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    -128,  # i8 min
-                    0,
-                    None,
-                    127],  # i8 max
-                dtype=pd.Int8Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=-128i,b="d"\n' +
-            'tbl1 a=0i,b="e"\n' +
-            'tbl1 b="f"\n' +
-            'tbl1 a=127i,b="g"\n')
-
-    def test_u16_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    0,
-                    None,
-                    65535],  # u16 max
-                dtype=pd.UInt16Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=0i,b="d"\n' +
-            'tbl1 b="e"\n' +
-            'tbl1 a=65535i,b="f"\n')
-
-    def test_i16_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    -32768,  # i16 min
-                    0,
-                    None,
-                    32767],  # i16 max
-                dtype=pd.Int16Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=-32768i,b="d"\n' +
-            'tbl1 a=0i,b="e"\n' +
-            'tbl1 b="f"\n' +
-            'tbl1 a=32767i,b="g"\n')
-
-    def test_u32_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    0,
-                    None,
-                    4294967295],  # u32 max
-                dtype=pd.UInt32Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=0i,b="d"\n' +
-            'tbl1 b="e"\n' +
-            'tbl1 a=4294967295i,b="f"\n')
-
-    def test_i32_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    -2147483648,  # i32 min
-                    0,
-                    None,
-                    2147483647],  # i32 max
-                dtype=pd.Int32Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=-2147483648i,b="d"\n' +
-            'tbl1 a=0i,b="e"\n' +
-            'tbl1 b="f"\n' +
-            'tbl1 a=2147483647i,b="g"\n')
-
-    def test_u64_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    0,
-                    None,
-                    9223372036854775807],  # i64 max
-                dtype=pd.UInt64Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=0i,b="d"\n' +
-            'tbl1 b="e"\n' +
-            'tbl1 a=9223372036854775807i,b="f"\n')
-
+    def test_u64_arrow_col_overflow(self):
         df2 = pd.DataFrame({'a': pd.Series([
                 1, 2, 3,
                 0,
@@ -634,117 +796,40 @@ class TestPandas(unittest.TestCase):
             dtype=pd.UInt64Dtype())})
         with self.assertRaisesRegex(
                 qi.IngressError,
-                '.* serialize .* column .a. .* 4 .*9223372036854775808.*int64.*'):
-            _dataframe(df2, table_name='tbl1', at=qi.ServerTimestamp)
-
-    def test_i64_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1, 2, 3,
-                    -9223372036854775808,  # i64 min
-                    0,
-                    None,
-                    9223372036854775807],  # i64 max
-                dtype=pd.Int64Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1i,b="a"\n' +
-            'tbl1 a=2i,b="b"\n' +
-            'tbl1 a=3i,b="c"\n' +
-            'tbl1 a=-9223372036854775808i,b="d"\n' +
-            'tbl1 a=0i,b="e"\n' +
-            'tbl1 b="f"\n' +
-            'tbl1 a=9223372036854775807i,b="g"\n')
-
-    def test_f32_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1.0, 2.0, 3.0,
-                    0.0,
-                    float('inf'),
-                    float('-inf'),
-                    float('nan'),
-                    3.4028234663852886e38,  # f32 max
-                    None],
-                dtype=pd.Float32Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1.0,b="a"\n' +
-            'tbl1 a=2.0,b="b"\n' +
-            'tbl1 a=3.0,b="c"\n' +
-            'tbl1 a=0.0,b="d"\n' +
-            'tbl1 a=Infinity,b="e"\n' +
-            'tbl1 a=-Infinity,b="f"\n' +
-            'tbl1 b="g"\n' +  # This one is wierd: `nan` gets 0 in the bitmask.
-            'tbl1 a=3.4028234663852886e38,b="h"\n' +
-            'tbl1 b="i"\n')
-
-    def test_f64_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    1.0, 2.0, 3.0,
-                    0.0,
-                    float('inf'),
-                    float('-inf'),
-                    float('nan'),
-                    1.7976931348623157e308,  # f64 max
-                    None],
-                dtype=pd.Float64Dtype()),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1.0,b="a"\n' +
-            'tbl1 a=2.0,b="b"\n' +
-            'tbl1 a=3.0,b="c"\n' +
-            'tbl1 a=0.0,b="d"\n' +
-            'tbl1 a=Infinity,b="e"\n' +
-            'tbl1 a=-Infinity,b="f"\n' +
-            'tbl1 b="g"\n' +  # This one is wierd: `nan` gets 0 in the bitmask.
-            'tbl1 a=1.7976931348623157e308,b="h"\n' +
-            'tbl1 b="i"\n')
+                _RE_U64_OVERFLOW):
+            self._df(df2, table_name='tbl1', at=qi.ServerTimestamp)
+
+    def test_float_numpy_cols(self):
+        for dtype, max_val, max_exp in _FLOAT_CASES:
+            with self.subTest(dtype=dtype):
+                df = _df_float_numpy(dtype, _FLOAT_VALS + (max_val,))
+                buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+                self.assertEqual(
+                    buf,
+                    _EXP_FLOAT_NUMPY +
+                    f'tbl1 a={max_exp}\n')
+
+    def test_float_arrow_cols(self):
+        for dtype, max_val, max_exp in _FLOAT_CASES:
+            dtype = dtype.capitalize()  # Nullable `Float32` / `Float64`.
+            with self.subTest(dtype=dtype):
+                df = _df_float_arrow(dtype, _FLOAT_VALS + (max_val, None))
+                buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+                self.assertEqual(
+                    buf,
+                    _EXP_FLOAT_ARROW +
+                    f'tbl1 a={max_exp},b="h"\n'
+                    'tbl1 b="i"\n')
 
     def test_bool_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                True, False, False,
-                False, True, False],
-            dtype='bool')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=t\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=t\n' +
-            'tbl1 a=f\n')
+        df = _df_bool_numpy()
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_BOOL_VALUES)
 
     def test_bool_arrow_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                True, False, False,
-                False, True, False,
-                True, True, True,
-                False, False, False],
-            dtype='boolean')})  # Note `boolean` != `bool`.
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=t\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=t\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=t\n' +
-            'tbl1 a=t\n' +
-            'tbl1 a=t\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n')
+        df = _df_bool_arrow()
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_BOOL_ARROW)
 
         df2 = pd.DataFrame({'a': pd.Series([
                 True, False, False,
@@ -753,148 +838,80 @@ class TestPandas(unittest.TestCase):
         with self.assertRaisesRegex(
                 qi.IngressError,
                 'Failed.*at row index 3 .*<NA>.: .*insert null .*boolean col'):
-            _dataframe(df2, table_name='tbl1', at=qi.ServerTimestamp)
+            self._df(df2, table_name='tbl1', at=qi.ServerTimestamp)
 
     def test_bool_obj_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                True, False, False,
-                False, True, False],
-            dtype='object')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=t\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=f\n' +
-            'tbl1 a=t\n' +
-            'tbl1 a=f\n')
+        df = _df_bool_obj()
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_BOOL_VALUES)
 
-        df2 = pd.DataFrame({'a': pd.Series([
+        df2 = pd.DataFrame({'a': np.array([
                 True, False, 'false'],
             dtype='object')})
         with self.assertRaisesRegex(
                 qi.IngressError,
                 'serialize .* column .a. .* 2 .*false.*bool'):
-            _dataframe(df2, table_name='tbl1', at=qi.ServerTimestamp)
+            self._df(df2, table_name='tbl1', at=qi.ServerTimestamp)
 
-        df3 = pd.DataFrame({'a': pd.Series([
+        df3 = pd.DataFrame({'a': np.array([
                 None, True, False],
             dtype='object')})
         with self.assertRaisesRegex(
                 qi.IngressError,
                 'serialize.*\\(None\\): Cannot insert null.*boolean column'):
-            _dataframe(df3, table_name='tbl1', at=qi.ServerTimestamp)
+            self._df(df3, table_name='tbl1', at=qi.ServerTimestamp)
 
     def test_datetime64_numpy_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                    pd.Timestamp('2019-01-01 00:00:00'),
-                    pd.Timestamp('2019-01-01 00:00:01'),
-                    pd.Timestamp('2019-01-01 00:00:02'),
-                    pd.Timestamp('2019-01-01 00:00:03'),
-                    pd.Timestamp('2019-01-01 00:00:04'),
-                    pd.Timestamp('2019-01-01 00:00:05'),
-                    None,
-                    float('nan'),
-                    pd.NA],
-                dtype='datetime64[ns]'),
-            'b': ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a=1546300800000000t,b="a"\n' +
-            'tbl1 a=1546300801000000t,b="b"\n' +
-            'tbl1 a=1546300802000000t,b="c"\n' +
-            'tbl1 a=1546300803000000t,b="d"\n' +
-            'tbl1 a=1546300804000000t,b="e"\n' +
-            'tbl1 a=1546300805000000t,b="f"\n' +
-            'tbl1 b="g"\n' +
-            'tbl1 b="h"\n' +
-            'tbl1 b="i"\n')
+        df = _df_datetime64_numpy()
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_DATETIME64_NUMPY)
 
-        df = pd.DataFrame({'a': pd.Series([
-                pd.Timestamp('1970-01-01 00:00:00'),
-                pd.Timestamp('1970-01-01 00:00:01'),
-                pd.Timestamp('1970-01-01 00:00:02')])})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
+        df = _df_datetime64_numpy_epoch()
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'tbl1 a=0t\n' +
-            'tbl1 a=1000000t\n' +
+            'tbl1 a=0t\n'
+            'tbl1 a=1000000t\n'
             'tbl1 a=2000000t\n')
 
     def test_datetime64_tz_arrow_col(self):
-        df = pd.DataFrame({
-            'a': [
-                pd.Timestamp(
-                    year=2019, month=1, day=1,
-                    hour=0, minute=0, second=0, tz=_TZ),
-                pd.Timestamp(
-                    year=2019, month=1, day=1,
-                    hour=0, minute=0, second=1, tz=_TZ),
-                None,
-                pd.Timestamp(
-                    year=2019, month=1, day=1,
-                    hour=0, minute=0, second=3, tz=_TZ)],
-            'b': ['sym1', 'sym2', 'sym3', 'sym4']})
-        buf = _dataframe(df, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
+        df = _df_datetime64_tz_arrow()
+        buf = self._df(df, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
             # Note how these are 5hr offset from `test_datetime64_numpy_col`.
-            'tbl1,b=sym1 a=1546318800000000t\n' +
-            'tbl1,b=sym2 a=1546318801000000t\n' +
-            'tbl1,b=sym3\n' +
+            'tbl1,b=sym1 a=1546318800000000t\n'
+            'tbl1,b=sym2 a=1546318801000000t\n'
+            'tbl1,b=sym3\n'
             'tbl1,b=sym4 a=1546318803000000t\n')
 
         # Not epoch 0.
-        df = pd.DataFrame({
-            'a': [
-                pd.Timestamp(
-                    year=1970, month=1, day=1,
-                    hour=0, minute=0, second=0, tz=_TZ),
-                pd.Timestamp(
-                    year=1970, month=1, day=1,
-                    hour=0, minute=0, second=1, tz=_TZ),
-                pd.Timestamp(
-                    year=1970, month=1, day=1,
-                    hour=0, minute=0, second=2, tz=_TZ)],
-            'b': ['sym1', 'sym2', 'sym3']})
-        buf = _dataframe(df, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
+        df = _df_datetime64_tz(
+            '1970-01-01T00:00:00',
+            '1970-01-01T00:00:01',
+            '1970-01-01T00:00:02')
+        buf = self._df(df, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
             # Note how these are 5hr offset from `test_datetime64_numpy_col`.
-            'tbl1,b=sym1 a=18000000000t\n' +
-            'tbl1,b=sym2 a=18001000000t\n' +
+            'tbl1,b=sym1 a=18000000000t\n'
+            'tbl1,b=sym2 a=18001000000t\n'
             'tbl1,b=sym3 a=18002000000t\n')
 
         # Actual epoch 0.
-        df = pd.DataFrame({
-            'a': [
-                pd.Timestamp(
-                    year=1969, month=12, day=31,
-                    hour=19, minute=0, second=0, tz=_TZ),
-                pd.Timestamp(
-                    year=1969, month=12, day=31,
-                    hour=19, minute=0, second=1, tz=_TZ),
-                pd.Timestamp(
-                    year=1969, month=12, day=31,
-                    hour=19, minute=0, second=2, tz=_TZ)],
-            'b': ['sym1', 'sym2', 'sym3']})
-        buf = _dataframe(df, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
+        df = _df_datetime64_tz(
+            '1969-12-31T19:00:00',
+            '1969-12-31T19:00:01',
+            '1969-12-31T19:00:02')
+        buf = self._df(df, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'tbl1,b=sym1 a=0t\n' +
-            'tbl1,b=sym2 a=1000000t\n' +
+            'tbl1,b=sym1 a=0t\n'
+            'tbl1,b=sym2 a=1000000t\n'
             'tbl1,b=sym3 a=2000000t\n')
 
-        df2 = pd.DataFrame({
-            'a': [
-                pd.Timestamp(
-                    year=1900, month=1, day=1,
-                    hour=0, minute=0, second=0, tz=_TZ)],
-            'b': ['sym1']})
-        buf = _dataframe(df2, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
+        df2 = _df_datetime64_tz('1900-01-01T00:00:00')
+        buf = self._df(df2, table_name='tbl1', symbols=['b'], at=qi.ServerTimestamp)
 
         # Accounting for different datatime library differences.
         # Mostly, here assert that negative timestamps are allowed.
@@ -905,139 +922,113 @@ class TestPandas(unittest.TestCase):
 
     def test_datetime64_numpy_at(self):
         df = pd.DataFrame({
-            'a': pd.Series([
-                    pd.Timestamp('2019-01-01 00:00:00'),
-                    pd.Timestamp('2019-01-01 00:00:01'),
-                    pd.Timestamp('2019-01-01 00:00:02'),
-                    pd.Timestamp('2019-01-01 00:00:03'),
-                    pd.Timestamp('2019-01-01 00:00:04'),
-                    pd.Timestamp('2019-01-01 00:00:05'),
-                    float('nan'),
-                    None,
-                    pd.NaT],
-                dtype='datetime64[ns]'),
+            'a': _datetime64_ns_with_nulls(),
             'b': [1, 2, 3, 4, 5, 6, 7, 8, 9]})
-        buf = _dataframe(df, table_name='tbl1', at='a')
+        buf = self._df(df, table_name='tbl1', at='a')
         self.assertEqual(
             buf,
-            'tbl1 b=1i 1546300800000000000\n' +
-            'tbl1 b=2i 1546300801000000000\n' +
-            'tbl1 b=3i 1546300802000000000\n' +
-            'tbl1 b=4i 1546300803000000000\n' +
-            'tbl1 b=5i 1546300804000000000\n' +
-            'tbl1 b=6i 1546300805000000000\n' +
-            'tbl1 b=7i\n' +
-            'tbl1 b=8i\n' +
+            'tbl1 b=1i 1546300800000000000\n'
+            'tbl1 b=2i 1546300801000000000\n'
+            'tbl1 b=3i 1546300802000000000\n'
+            'tbl1 b=4i 1546300803000000000\n'
+            'tbl1 b=5i 1546300804000000000\n'
+            'tbl1 b=6i 1546300805000000000\n'
+            'tbl1 b=7i\n'
+            'tbl1 b=8i\n'
             'tbl1 b=9i\n')
 
         df = pd.DataFrame({
-            'a': pd.Series([
-                    pd.Timestamp('1970-01-01 00:00:00'),
-                    pd.Timestamp('1970-01-01 00:00:01'),
-                    pd.Timestamp('1970-01-01 00:00:02')],
+            'a': np.array([
+                    '1970-01-01T00:00:00',
+                    '1970-01-01T00:00:01',
+                    '1970-01-01T00:00:02'],
                 dtype='datetime64[ns]'),
             'b': [1, 2, 3]})
-        buf = _dataframe(df, table_name='tbl1', at='a')
+        buf = self._df(df, table_name='tbl1', at='a')
         self.assertEqual(
             buf,
-            'tbl1 b=1i 0\n' +
-            'tbl1 b=2i 1000000000\n' +
+            'tbl1 b=1i 0\n'
+            'tbl1 b=2i 1000000000\n'
             'tbl1 b=3i 2000000000\n')
 
     def test_datetime64_tz_arrow_at(self):
-        df = pd.DataFrame({
-            'a': [
-                pd.Timestamp(
-                    year=2019, month=1, day=1,
-                    hour=0, minute=0, second=0, tz=_TZ),
-                pd.Timestamp(
-                    year=2019, month=1, day=1,
-                    hour=0, minute=0, second=1, tz=_TZ),
-                None,
-                pd.Timestamp(
-                    year=2019, month=1, day=1,
-                    hour=0, minute=0, second=3, tz=_TZ)],
-            'b': ['sym1', 'sym2', 'sym3', 'sym4']})
-        buf = _dataframe(df, table_name='tbl1', symbols=['b'], at='a')
+        df = _df_datetime64_tz_arrow()
+        buf = self._df(df, table_name='tbl1', symbols=['b'], at='a')
         self.assertEqual(
             buf,
             # Note how these are 5hr offset from `test_datetime64_numpy_col`.
-            'tbl1,b=sym1 1546318800000000000\n' +
-            'tbl1,b=sym2 1546318801000000000\n' +
-            'tbl1,b=sym3\n' +
+            'tbl1,b=sym1 1546318800000000000\n'
+            'tbl1,b=sym2 1546318801000000000\n'
+            'tbl1,b=sym3\n'
             'tbl1,b=sym4 1546318803000000000\n')
 
-        df2 = pd.DataFrame({
-            'a': [
-                pd.Timestamp(
-                    year=1900, month=1, day=1,
-                    hour=0, minute=0, second=0, tz=_TZ)],
-            'b': ['sym1']})
+        df2 = _df_datetime64_tz('1900-01-01T00:00:00')
         with self.assertRaisesRegex(
                 qi.IngressError, "Failed.*'a'.*-220897.* is neg"):
-            _dataframe(df2, table_name='tbl1', symbols=['b'], at='a')
+            self._df(df2, table_name='tbl1', symbols=['b'], at='a')
 
     def _test_pyobjstr_table(self, dtype):
         df = pd.DataFrame({
             '../bad col name/../it does not matter...':
                 pd.Series([
                     'a',                     # ASCII
-                    'b' * 127,               # Max table name length.
+                    _MAX_TABLE_NAME,         # Max table name length.
                     'q❤️p',                   # Mixed ASCII and UCS-2
                     '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
                     '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
                 dtype=dtype),
             'b': [1, 2, 3, 4, 5]})
-        buf = _dataframe(df, table_name_col=0, at=qi.ServerTimestamp)
+        buf = self._df(df, table_name_col=0, at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'a b=1i\n' +
-            ('b' * 127) + ' b=2i\n' +
-            'q❤️p b=3i\n' +
-            '嚜꓂ b=4i\n' +
+            'a b=1i\n'
+            f"{_MAX_TABLE_NAME} b=2i\n"
+            'q❤️p b=3i\n'
+            '嚜꓂ b=4i\n'
             '💩🦞 b=5i\n')
 
         with self.assertRaisesRegex(
-                qi.IngressError, "Too long"):
-            _dataframe(
-                pd.DataFrame({'a': pd.Series(['b' * 128], dtype=dtype)}),
+                qi.IngressError, _RE_TOO_LONG):
+            self._df(
+                pd.DataFrame({
+                    'a': pd.Series([_TOO_LONG_TABLE_NAME], dtype=dtype)}),
                 table_name_col='a', at=qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
-                qi.IngressError, 'Failed.*Expected a table name, got a null.*'):
-            _dataframe(
+                qi.IngressError, _RE_NULL_TABLE_NAME):
+            self._df(
                 pd.DataFrame({
                     '.': pd.Series(['x', None], dtype=dtype),
                     'b': [1, 2]}),
                 table_name_col='.', at=qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
-                qi.IngressError, 'Failed.*Expected a table name, got a null.*'):
-            _dataframe(
+                qi.IngressError, _RE_NULL_TABLE_NAME):
+            self._df(
                 pd.DataFrame({
                     '.': pd.Series(['x', float('nan')], dtype=dtype),
                     'b': [1, 2]}),
                 table_name_col='.', at=qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
-                qi.IngressError, 'Failed.*Expected a table name, got a null.*'):
-            _dataframe(
+                qi.IngressError, _RE_NULL_TABLE_NAME):
+            self._df(
                 pd.DataFrame({
                     '.': pd.Series(['x', pd.NA], dtype=dtype),
                     'b': [1, 2]}),
                 table_name_col='.', at=qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
-                qi.IngressError, "''.*must have a non-zero length"):
-            _dataframe(
+                qi.IngressError, _RE_EMPTY_TABLE_NAME):
+            self._df(
                 pd.DataFrame({
                     '/': pd.Series([''], dtype=dtype),
                     'b': [1]}),
                 table_name_col='/', at=qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
-                qi.IngressError, "'tab..1'.*invalid dot `\\.` at position 4"):
-            _dataframe(
+                qi.IngressError, _RE_BAD_DOT):
+            self._df(
                 pd.DataFrame({
                     '/': pd.Series(['tab..1'], dtype=dtype),
                     'b': [1]}),
@@ -1048,7 +1039,7 @@ class TestPandas(unittest.TestCase):
 
         with self.assertRaisesRegex(
                 qi.IngressError, 'table name .*got an object of type int'):
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     '.': pd.Series(['x', 42], dtype='object'),
                     'z': [1, 2]}),
@@ -1058,45 +1049,36 @@ class TestPandas(unittest.TestCase):
         self._test_pyobjstr_table('string')
 
         self.assertEqual(
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     '.': pd.Series(['x', 42], dtype='string'),
                     'z': [1, 2]}),
                 table_name_col='.', at=qi.ServerTimestamp),
-            'x z=1i\n' +
+            'x z=1i\n'
             '42 z=2i\n')
 
     def _test_pyobjstr_numpy_symbol(self, dtype):
         df = pd.DataFrame({'a': pd.Series([
                 'a',                     # ASCII
                 'q❤️p',                   # Mixed ASCII and UCS-2
-                '❤️' * 1200,              # Over the 1024 buffer prealloc.
+                _LONG_STR,                # Over the 1024 buffer prealloc.
                 'Questo è un qualcosa',  # Non-ASCII UCS-1
                 'щось',                  # UCS-2, 2 bytes for UTF-8.
                 '',                      # Empty string
                 '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
                 '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
             dtype=dtype)})
-        buf = _dataframe(df, table_name='tbl1', symbols=True, at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1,a=a\n' +
-            'tbl1,a=q❤️p\n' +
-            'tbl1,a=' + ('❤️' * 1200) + '\n' +
-            'tbl1,a=Questo\\ è\\ un\\ qualcosa\n' +
-            'tbl1,a=щось\n' +
-            'tbl1,a=\n' +
-            'tbl1,a=嚜꓂\n' +
-            'tbl1,a=💩🦞\n')
+        buf = self._df(df, table_name='tbl1', symbols=True, at=qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_STR_NUMPY_SYMBOL)
 
         for null_obj in (None, float('nan'), pd.NA):
             self.assertEqual(
-                _dataframe(
+                self._df(
                     pd.DataFrame({
                         'x': pd.Series(['a', null_obj], dtype=dtype),
                         'y': [1, 2]}),
                     table_name='tbl1', symbols=[0], at=qi.ServerTimestamp),
-                'tbl1,x=a y=1i\n' +
+                'tbl1,x=a y=1i\n'
                 'tbl1 y=2i\n')
 
     def test_obj_str_numpy_symbol(self):
@@ -1104,7 +1086,7 @@ class TestPandas(unittest.TestCase):
 
         with self.assertRaisesRegex(
                 qi.IngressError, 'Expected a string, got an .* type int'):
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     'x': pd.Series(['x', 42], dtype='object'),
                     'y': [1, 2]}),
@@ -1114,144 +1096,83 @@ class TestPandas(unittest.TestCase):
         self._test_pyobjstr_numpy_symbol('string')
 
         self.assertEqual(
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     'x': pd.Series(['x', 42], dtype='string'),
                     'y': [1, 2]}),
                 table_name='tbl1', symbols=[0], at=qi.ServerTimestamp),
-            'tbl1,x=x y=1i\n' +
+            'tbl1,x=x y=1i\n'
             'tbl1,x=42 y=2i\n')
 
     def test_str_numpy_col(self):
-        df = pd.DataFrame({'a': pd.Series([
-                'a',                     # ASCII
-                'q❤️p',                   # Mixed ASCII and UCS-2
-                '❤️' * 1200,              # Over the 1024 buffer prealloc.
-                'Questo è un qualcosa',  # Non-ASCII UCS-1
-                'щось',                  # UCS-2, 2 bytes for UTF-8.
-                '',                      # Empty string
-                '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
-                '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
-            dtype='str')})
-        buf = _dataframe(df, table_name='tbl1', at=qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a="a"\n' +
-            'tbl1 a="q❤️p"\n' +
-            'tbl1 a="' + ('❤️' * 1200) + '"\n' +
-            'tbl1 a="Questo è un qualcosa"\n' +
-            'tbl1 a="щось"\n' +
-            'tbl1 a=""\n' +
-            'tbl1 a="嚜꓂"\n' +
-            'tbl1 a="💩🦞"\n')
+        df = _df_str_numpy()
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_STR_NUMPY_COL)
 
     def test_str_arrow_table(self):
         df = pd.DataFrame({
             '../bad col name/../it does not matter...': pd.Series([
                 'a',                     # ASCII
-                'b' * 127,               # Max table name length.
+                _MAX_TABLE_NAME,         # Max table name length.
                 'q❤️p',                   # Mixed ASCII and UCS-2
                 '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
                 '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
                 dtype='string[pyarrow]'),
             'b': [1, 2, 3, 4, 5]})
-        buf = _dataframe(df, table_name_col=0, at=qi.ServerTimestamp)
+        buf = self._df(df, table_name_col=0, at=qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'a b=1i\n' +
-            ('b' * 127) + ' b=2i\n' +
-            'q❤️p b=3i\n' +
-            '嚜꓂ b=4i\n' +
+            'a b=1i\n'
+            f"{_MAX_TABLE_NAME} b=2i\n"
+            'q❤️p b=3i\n'
+            '嚜꓂ b=4i\n'
             '💩🦞 b=5i\n')
 
         with self.assertRaisesRegex(
-                qi.IngressError, "Too long"):
-            _dataframe(
+                qi.IngressError, _RE_TOO_LONG):
+            self._df(
                 pd.DataFrame({
-                    'a': pd.Series(['b' * 128], dtype='string[pyarrow]')}),
+                    'a': pd.Series(
+                        [_TOO_LONG_TABLE_NAME], dtype='string[pyarrow]')}),
                 table_name_col='a', at = qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
                 qi.IngressError, "Failed .*<NA>.*Table name cannot be null"):
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     '.': pd.Series(['x', None], dtype='string[pyarrow]'),
                     'b': [1, 2]}),
                 table_name_col='.', at = qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
-                qi.IngressError, "''.*must have a non-zero length"):
-            _dataframe(
+                qi.IngressError, _RE_EMPTY_TABLE_NAME):
+            self._df(
                 pd.DataFrame({
                     '/': pd.Series([''], dtype='string[pyarrow]')}),
                 table_name_col='/', at = qi.ServerTimestamp)
 
         with self.assertRaisesRegex(
-                qi.IngressError, "'tab..1'.*invalid dot `\\.` at position 4"):
-            _dataframe(
+                qi.IngressError, _RE_BAD_DOT):
+            self._df(
                 pd.DataFrame({
                     '/': pd.Series(['tab..1'], dtype='string[pyarrow]')}),
                 table_name_col='/', at = qi.ServerTimestamp)
 
     def test_str_arrow_symbol(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                'a',                     # ASCII
-                'q❤️p',                   # Mixed ASCII and UCS-2
-                '❤️' * 1200,              # Over the 1024 buffer prealloc.
-                'Questo è un qualcosa',  # Non-ASCII UCS-1
-                'щось',                  # UCS-2, 2 bytes for UTF-8.
-                '',                      # Empty string
-                None,
-                '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
-                '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
-                dtype='string[pyarrow]'),
-            'b': [1, 2, 3, 4, 5, 6, 7, 8, 9]})
-        buf = _dataframe(df, table_name='tbl1', symbols=True, at = qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1,a=a b=1i\n' +
-            'tbl1,a=q❤️p b=2i\n' +
-            'tbl1,a=' + ('❤️' * 1200) + ' b=3i\n' +
-            'tbl1,a=Questo\\ è\\ un\\ qualcosa b=4i\n' +
-            'tbl1,a=щось b=5i\n' +
-            'tbl1,a= b=6i\n' +
-            'tbl1 b=7i\n' +
-            'tbl1,a=嚜꓂ b=8i\n' +
-            'tbl1,a=💩🦞 b=9i\n')
+        df = _df_str_arrow()
+        buf = self._df(df, table_name='tbl1', symbols=True, at = qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_STR_ARROW_SYMBOL)
 
     def test_str_arrow_col(self):
-        df = pd.DataFrame({
-            'a': pd.Series([
-                'a',                     # ASCII
-                'q❤️p',                   # Mixed ASCII and UCS-2
-                '❤️' * 1200,              # Over the 1024 buffer prealloc.
-                'Questo è un qualcosa',  # Non-ASCII UCS-1
-                'щось',                  # UCS-2, 2 bytes for UTF-8.
-                '',                      # Empty string
-                None,
-                '嚜꓂',                   # UCS-2, 3 bytes for UTF-8.
-                '💩🦞'],                 # UCS-4, 4 bytes for UTF-8.
-                dtype='string[pyarrow]'),
-            'b': [1, 2, 3, 4, 5, 6, 7, 8, 9]})
-        buf = _dataframe(df, table_name='tbl1', symbols=False, at = qi.ServerTimestamp)
-        self.assertEqual(
-            buf,
-            'tbl1 a="a",b=1i\n' +
-            'tbl1 a="q❤️p",b=2i\n' +
-            'tbl1 a="' + ('❤️' * 1200) + '",b=3i\n' +
-            'tbl1 a="Questo è un qualcosa",b=4i\n' +
-            'tbl1 a="щось",b=5i\n' +
-            'tbl1 a="",b=6i\n' +
-            'tbl1 b=7i\n' +
-            'tbl1 a="嚜꓂",b=8i\n' +
-            'tbl1 a="💩🦞",b=9i\n')
+        df = _df_str_arrow()
+        buf = self._df(df, table_name='tbl1', symbols=False, at = qi.ServerTimestamp)
+        self.assertEqual(buf, _EXP_STR_ARROW_COL)
 
     def test_pyobj_int_col(self):
         int64_min = -2**63
         int64_max = 2**63 - 1
         self.assertEqual(
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     'a': pd.Series([
                         1, 2, 3, None, float('nan'), pd.NA, 7,
@@ -1260,20 +1181,20 @@ class TestPandas(unittest.TestCase):
                         int64_max], dtype='object'),
                     'b': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]}),
                 table_name='tbl1', at = qi.ServerTimestamp),
-            'tbl1 a=1i,b=1i\n' +
-            'tbl1 a=2i,b=2i\n' +
-            'tbl1 a=3i,b=3i\n' +
-            'tbl1 b=4i\n' +
-            'tbl1 b=5i\n' +
-            'tbl1 b=6i\n' +
-            'tbl1 a=7i,b=7i\n' +
-            'tbl1 a=0i,b=8i\n' +
-            'tbl1 a=' + str(int64_min) + 'i,b=9i\n' +
-            'tbl1 a=' + str(int64_max) + 'i,b=10i\n')
+            'tbl1 a=1i,b=1i\n'
+            'tbl1 a=2i,b=2i\n'
+            'tbl1 a=3i,b=3i\n'
+            'tbl1 b=4i\n'
+            'tbl1 b=5i\n'
+            'tbl1 b=6i\n'
+            'tbl1 a=7i,b=7i\n'
+            'tbl1 a=0i,b=8i\n'
+            f'tbl1 a={int64_min}i,b=9i\n'
+            f'tbl1 a={int64_max}i,b=10i\n')
 
         with self.assertRaisesRegex(
                 qi.IngressError, "1 \\('STRING'\\): .*type int, got.*str\\."):
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     'a': pd.Series([1, 'STRING'], dtype='object'),
                     'b': [1, 2]}),
@@ -1283,7 +1204,7 @@ class TestPandas(unittest.TestCase):
         for num in out_of_range:
             with self.assertRaisesRegex(
                     qi.IngressError, "index 1 .*922337203685477.*int too big"):
-                _dataframe(
+                self._df(
                     pd.DataFrame({
                         'a': pd.Series([1, num], dtype='object'),
                         'b': [1, 2]}),
@@ -1291,24 +1212,24 @@ class TestPandas(unittest.TestCase):
 
     def test_pyobj_float_col(self):
         self.assertEqual(
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     'a': pd.Series(
                         [1.0, 2.0, 3.0, None, float('nan'), pd.NA, 7.0],
                         dtype='object'),
                     'b': [1, 2, 3, 4, 5, 6, 7]}),
                 table_name='tbl1', at = qi.ServerTimestamp),
-            'tbl1 a=1.0,b=1i\n' +
-            'tbl1 a=2.0,b=2i\n' +
-            'tbl1 a=3.0,b=3i\n' +
-            'tbl1 b=4i\n' +
-            'tbl1 a=NaN,b=5i\n' +
-            'tbl1 b=6i\n' +
+            'tbl1 a=1.0,b=1i\n'
+            'tbl1 a=2.0,b=2i\n'
+            'tbl1 a=3.0,b=3i\n'
+            'tbl1 b=4i\n'
+            'tbl1 a=NaN,b=5i\n'
+            'tbl1 b=6i\n'
             'tbl1 a=7.0,b=7i\n')
 
         with self.assertRaisesRegex(
                 qi.IngressError, "1 \\('STRING'\\): .*type float, got.*str\\."):
-            _dataframe(
+            self._df(
                 pd.DataFrame({
                     'a': pd.Series([1.0, 'STRING'], dtype='object'),
                     'b': [1, 2]}),
@@ -1320,123 +1241,98 @@ class TestPandas(unittest.TestCase):
         # We want to test others are rejected.
         with self.assertRaisesRegex(
                 qi.IngressError, "Bad column 'a'.*got a category of .*int64"):
-            _dataframe(
+            self._df(
                 pd.DataFrame({'a': pd.Series([1, 2, 3, 2], dtype='category')}),
                 table_name='tbl1', at = qi.ServerTimestamp)
 
-    def _test_cat_table(self, count):
-        slist = [f's{i}' for i in range(count)]
+    def _test_cat_counts(self, check, counts):
+        for count in counts:
+            with self.subTest(count=count):
+                check(count)
 
-        df = pd.DataFrame({
-            'a': pd.Series(slist, dtype='category'),
-            'b': list(range(len(slist)))})
+    # The expected output of the `_test_cat_*` tests is built with a list
+    # comprehension: `str.join` materializes a generator into a list
+    # first anyway, which is measurably slower for 40000 rows.
+    def _test_cat_table(self, count):
+        df = _df_cat(count)
 
-        buf = _dataframe(df, table_name_col=0, at = qi.ServerTimestamp)
-        exp = ''.join(
-            f'{s} b={i}i\n'
-            for i, s in enumerate(slist))
+        buf = self._df(df, table_name_col=0, at = qi.ServerTimestamp)
+        exp = ''.join([
+            f's{i} b={i}i\n'
+            for i in range(count)])
         self.assertEqual(buf, exp)
 
-        slist[2] = None
-        df2 = pd.DataFrame({
-            'a': pd.Series(slist, dtype='category'),
-            'b': list(range(len(slist)))})
+        df2 = _df_cat(count, null_index=2)
         with self.assertRaisesRegex(
                 qi.IngressError, 'Table name cannot be null'):
-            _dataframe(df2, table_name_col=0, at = qi.ServerTimestamp)
+            self._df(df2, table_name_col=0, at = qi.ServerTimestamp)
 
     def test_cat_i8_table(self):
-        self._test_cat_table(30)
-        self._test_cat_table(127)
+        self._test_cat_counts(self._test_cat_table, _CAT_COUNTS_I8)
 
     def test_cat_i16_table(self):
-        self._test_cat_table(128)
-        self._test_cat_table(4000)
-        self._test_cat_table(32767)
+        self._test_cat_counts(self._test_cat_table, _CAT_COUNTS_I16)
 
     def test_cat_i32_table(self):
-        self._test_cat_table(32768)
-        self._test_cat_table(40000)
+        self._test_cat_counts(self._test_cat_table, _CAT_COUNTS_I32)
 
     def _test_cat_symbol(self, count):
-        slist = [f's{i}' for i in range(count)]
+        df = _df_cat(count)
 
-        df = pd.DataFrame({
-            'a': pd.Series(slist, dtype='category'),
-            'b': list(range(len(slist)))})
-
-        buf = _dataframe(df, table_name='tbl1', symbols=True, at = qi.ServerTimestamp)
-        exp = ''.join(
-            f'tbl1,a={s} b={i}i\n'
-            for i, s in enumerate(slist))
+        buf = self._df(df, table_name='tbl1', symbols=True, at = qi.ServerTimestamp)
+        exp = ''.join([
+            f'tbl1,a=s{i} b={i}i\n'
+            for i in range(count)])
         self.assertEqual(buf, exp)
 
-        slist[2] = None
-        df2 = pd.DataFrame({
-            'a': pd.Series(slist, dtype='category'),
-            'b': list(range(len(slist)))})
+        df2 = _df_cat(count, null_index=2)
 
         exp2 = exp.replace('tbl1,a=s2 b=2i\n', 'tbl1 b=2i\n')
-        buf2 = _dataframe(df2, table_name='tbl1', symbols=True, at = qi.ServerTimestamp)
+        buf2 = self._df(df2, table_name='tbl1', symbols=True, at = qi.ServerTimestamp)
         self.assertEqual(buf2, exp2)
 
     def test_cat_i8_symbol(self):
-        self._test_cat_symbol(30)
-        self._test_cat_symbol(127)
+        self._test_cat_counts(self._test_cat_symbol, _CAT_COUNTS_I8)
 
     def test_cat_i16_symbol(self):
-        self._test_cat_symbol(128)
-        self._test_cat_symbol(4000)
-        self._test_cat_symbol(32767)
+        self._test_cat_counts(self._test_cat_symbol, _CAT_COUNTS_I16)
 
     def test_cat_i32_symbol(self):
-        self._test_cat_symbol(32768)
-        self._test_cat_symbol(40000)
+        self._test_cat_counts(self._test_cat_symbol, _CAT_COUNTS_I32)
 
     def _test_cat_str(self, count):
-        slist = [f's{i}' for i in range(count)]
-
-        df = pd.DataFrame({
-            'a': pd.Series(slist, dtype='category'),
-            'b': list(range(len(slist)))})
+        df = _df_cat(count)
 
-        buf = _dataframe(df, table_name='tbl1', symbols=False, at = qi.ServerTimestamp)
-        exp = ''.join(
-            f'tbl1 a="{s}",b={i}i\n'
-            for i, s in enumerate(slist))
+        buf = self._df(df, table_name='tbl1', symbols=False, at = qi.ServerTimestamp)
+        exp = ''.join([
+            f'tbl1 a="s{i}",b={i}i\n'
+            for i in range(count)])
         self.assertEqual(buf, exp)
 
-        slist[2] = None
-        df2 = pd.DataFrame({
-            'a': pd.Series(slist, dtype='category'),
-            'b': list(range(len(slist)))})
+        df2 = _df_cat(count, null_index=2)
 
         exp2 = exp.replace('tbl1 a="s2",b=2i\n', 'tbl1 b=2i\n')
-        buf2 = _dataframe(df2, table_name='tbl1', symbols=False, at = qi.ServerTimestamp)
+        buf2 = self._df(df2, table_name='tbl1', symbols=False, at = qi.ServerTimestamp)
         self.assertEqual(buf2, exp2)
 
     def test_cat_i8_str(self):
-        self._test_cat_str(30)
-        self._test_cat_str(127)
+        self._test_cat_counts(self._test_cat_str, _CAT_COUNTS_I8)
 
     def test_cat_i16_str(self):
-        self._test_cat_str(128)
-        self._test_cat_str(4000)
-        self._test_cat_str(32767)
+        self._test_cat_counts(self._test_cat_str, _CAT_COUNTS_I16)
 
     def test_cat_i32_str(self):
-        self._test_cat_str(32768)
-        self._test_cat_str(40000)
+        self._test_cat_counts(self._test_cat_str, _CAT_COUNTS_I32)
 
     def test_all_nulls_pyobj_col(self):
         df = pd.DataFrame({
             'a': [None, pd.NA, float('nan')],
             'b': [1, 2, 3]})
-        buf = _dataframe(df, table_name='tbl1', at = qi.ServerTimestamp)
+        buf = self._df(df, table_name='tbl1', at = qi.ServerTimestamp)
         self.assertEqual(
             buf,
-            'tbl1 b=1i\n' +
-            'tbl1 b=2i\n' +
+            'tbl1 b=1i\n'
+            'tbl1 b=2i\n'
             'tbl1 b=3i\n')
 
     def test_strided_numpy_column(self):
@@ -1448,27 +1344,26 @@ class TestPandas(unittest.TestCase):
         col2.flags['WRITEABLE'] = False
 
         # Checking our test case setup.
-        mv = memoryview(col2)
-        self.assertEqual(mv.contiguous, False)
-        self.assertEqual(mv.strides, (16,))
+        self.assertEqual(col2.flags['C_CONTIGUOUS'], False)
+        self.assertEqual(col2.strides, (16,))
 
         df = pd.DataFrame(col2, copy=False)
         df.columns = ['a']
 
         with self.assertRaisesRegex(
                 qi.IngressError, "Bad column 'a': .*not.*contiguous"):
-            _dataframe(df, table_name='tbl1', at = qi.ServerTimestamp)
+            self._df(df, table_name='tbl1', at = qi.ServerTimestamp)
 
     def test_serializing_in_chunks(self):
         df = pd.DataFrame({
-            'a': pd.Series(np.arange(30), dtype='int64'),
+            'a': np.arange(30, dtype='int64'),
             'b': pd.Series(np.arange(30), dtype='Int64')})
         parts = [
             df.iloc[:10],
             df.iloc[10:20],
             df.iloc[20:]]
         for index, part in enumerate(parts):
-            buf = _dataframe(part, table_name='tbl1', at = qi.ServerTimestamp)
+            buf = self._df(part, table_name='tbl1', at = qi.ServerTimestamp)
             exp = ''.join(
                 f'tbl1 a={i}i,b={i}i\n'
                 for i in range(index * 10, (index + 1) * 10))
@@ -1493,16 +1388,16 @@ class TestPandas(unittest.TestCase):
         # NOTE!
         # This does *not* preserve the chunking of the arrow arrays.
         df = arr_tab.to_pandas()
-        buf = _dataframe(df, table_name='tbl1', at = qi.ServerTimestamp)
+        buf = self._df(df, table_name='tbl1', at = qi.ServerTimestamp)
         exp = (
-            'tbl1 a=1i,b=10i\n' +
-            'tbl1 a=2i,b=20i\n' +
-            'tbl1 a=3i,b=30i\n' +
-            'tbl1 a=4i,b=40i\n' +
-            'tbl1 a=5i,b=50i\n' +
-            'tbl1 a=6i,b=60i\n' +
-            'tbl1 a=7i,b=70i\n' +
-            'tbl1 a=8i,b=80i\n' +
+            'tbl1 a=1i,b=10i\n'
+            'tbl1 a=2i,b=20i\n'
+            'tbl1 a=3i,b=30i\n'
+            'tbl1 a=4i,b=40i\n'
+            'tbl1 a=5i,b=50i\n'
+            'tbl1 a=6i,b=60i\n'
+            'tbl1 a=7i,b=70i\n'
+            'tbl1 a=8i,b=80i\n'
             'tbl1 a=9i,b=90i\n')
         self.assertEqual(buf, exp)
 
@@ -1521,7 +1416,37 @@ class TestPandas(unittest.TestCase):
         with self.assertRaisesRegex(
                 qi.IngressError,
                 "Unsupported dtype int16\[pyarrow\] for column 'a'.*github"):
-            _dataframe(df, table_name='tbl1', at = qi.ServerTimestamp)
+            self._df(df, table_name='tbl1', at = qi.ServerTimestamp)
+
+    def test_sliced_arrow_cols(self):
+        # Slicing keeps the arrow buffers and sets a non-zero chunk offset.
+        df = pd.DataFrame({
+            'a': pd.Categorical(['x', 'y', 'x', 'z', 'y']),
+            'b': pd.Series(
+                ['a', 'bb', 'ccc', 'dddd', 'eeeee'],
+                dtype='string[pyarrow]')})
+        buf = self._df(
+            df.iloc[2:], table_name='tbl1', symbols=['a'],
+            at=qi.ServerTimestamp)
+        self.assertEqual(
+            buf,
+            'tbl1,a=x b="ccc"\n'
+            'tbl1,a=z b="dddd"\n'
+            'tbl1,a=y b="eeeee"\n')
+
+        # Several sliced chunks: Each one is read from its own offset.
+        arr = pa.array(['a', 'bb', 'ccc', 'dddd'])
+        df = pd.DataFrame({
+            'b': pd.arrays.ArrowStringArray(
+                pa.chunked_array([arr[1:], arr[2:3], arr[3:]]))})
+        buf = self._df(df, table_name='tbl1', at=qi.ServerTimestamp)
+        self.assertEqual(
+            buf,
+            'tbl1 b="bb"\n'
+            'tbl1 b="ccc"\n'
+            'tbl1 b="dddd"\n'
+            'tbl1 b="ccc"\n'
+            'tbl1 b="dddd"\n')
 
     @unittest.skipIf(not fastparquet, 'fastparquet not installed')
     @with_tmp_dir
@@ -1568,27 +1493,31 @@ class TestPandas(unittest.TestCase):
         df_eq(df, fp2fp_df, exp_dtypes)
 
         exp = (
-            'tbl1,s=a a=1i,b=10i,c=0.5\n' +
-            'tbl1,s=b a=2i,b=20i,c=NaN\n' +
-            'tbl1,s=a a=3i,b=30i,c=2.5\n' +
-            'tbl1,s=c a=4i,c=3.5\n' +
+            'tbl1,s=a a=1i,b=10i,c=0.5\n'
+            'tbl1,s=b a=2i,b=20i,c=NaN\n'
+            'tbl1,s=a a=3i,b=30i,c=2.5\n'
+            'tbl1,s=c a=4i,c=3.5\n'
             'tbl1,s=a a=5i,b=50i,c=NaN\n')
 
         fallback_exp = (
-            'tbl1 s="a",a=1i,b=10.0,c=0.5\n' +
-            'tbl1 s="b",a=2i,b=20.0,c=NaN\n' +
-            'tbl1 s="a",a=3i,b=30.0,c=2.5\n' +
-            'tbl1 s="c",a=4i,b=NaN,c=3.5\n' +
+            'tbl1 s="a",a=1i,b=10.0,c=0.5\n'
+            'tbl1 s="b",a=2i,b=20.0,c=NaN\n'
+            'tbl1 s="a",a=3i,b=30.0,c=2.5\n'
+            'tbl1 s="c",a=4i,b=NaN,c=3.5\n'
             'tbl1 s="a",a=5i,b=50.0,c=NaN\n')
 
-        self.assertEqual(_dataframe(df, table_name='tbl1', at=qi.ServerTimestamp), exp)
-        self.assertEqual(_dataframe(pa2pa_df, table_name='tbl1', at=qi.ServerTimestamp), exp)
-        self.assertEqual(_dataframe(pa2fp_df, table_name='tbl1', at=qi.ServerTimestamp), exp)
-        self.assertEqual(_dataframe(fp2pa_df, table_name='tbl1', at=qi.ServerTimestamp), fallback_exp)
-        self.assertEqual(_dataframe(fp2fp_df, table_name='tbl1', at=qi.ServerTimestamp), exp)
+        self.assertEqual(self._df(df, table_name='tbl1', at=qi.ServerTimestamp), exp)
+        self.assertEqual(self._df(pa2pa_df, table_name='tbl1', at=qi.ServerTimestamp), exp)
+        self.assertEqual(self._df(pa2fp_df, table_name='tbl1', at=qi.ServerTimestamp), exp)
+        self.assertEqual(self._df(fp2pa_df, table_name='tbl1', at=qi.ServerTimestamp), fallback_exp)
+        self.assertEqual(self._df(fp2fp_df, table_name='tbl1', at=qi.ServerTimestamp), exp)
 
 
 if __name__ == '__main__':
+    # To run a subset of tests, pass a name pattern to unittest, e.g.:
+    #     python3 test/test_dataframe.py -k arrow
+    # To spread the tests across processes, run them under pytest-xdist:
+    #     python3 -m pytest -n auto test/test_dataframe.py
     if os.environ.get('TEST_QUESTDB_PROFILE') == '1':
         import cProfile
         cProfile.run('unittest.main()', sort='cumtime')
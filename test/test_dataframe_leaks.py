@@ -1,9 +1,12 @@
 import patch_path
 patch_path.patch()
 
+import numpy as np
 import pandas as pd
 import questdb.ingress as qi
 
+import gc
+import sys
 import os, psutil
 process = psutil.Process(os.getpid())
 
@@ -11,33 +14,69 @@ def get_rss():
     return process.memory_info().rss 
 
 
+# Built once: Only the serialization path is under test.
+_DF = pd.DataFrame({
+    'a': np.arange(1, 17, dtype='int64'),
+    'b': np.arange(4, 20, dtype='int64'),
+    'c': np.arange(7, 23, dtype='int64')})
+
+# Reused by `serialize_reused`. That phase runs on its own, so any RSS
+# growth it reports is down to `.dataframe()` rather than to a buffer's
+# lifecycle.
+BUF = qi.Buffer()
+
+
 def serialize_and_cleanup():
     # qi.Buffer().row(
     #     'table_name',
     #     symbols={'x': 'a', 'y': 'b'},
     #     columns={'a': 1, 'b': 2, 'c': 3})
-    df = pd.DataFrame({
-        'a': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16],
-        'b': [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19],
-        'c': [7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22]})
-    qi.Buffer().dataframe(df, table_name='test', at=qi.ServerTimestamp)
+    # A new buffer each time: Construction and destruction leaks show up too.
+    qi.Buffer().dataframe(_DF, table_name='test', at=qi.ServerTimestamp)
+
+
+def serialize_reused():
+    BUF.clear()
+    BUF.dataframe(_DF, table_name='test', at=qi.ServerTimestamp)
+
+
+# Check RSS once every this many iterations.
+SAMPLE_INTERVAL = 1000
+
+# Flush the report to stdout once every this many samples.
+FLUSH_INTERVAL = 100
+
+
+def check_leaks(name, func, out):
+    before = get_rss()
+    for sample, n in enumerate(
+            range(SAMPLE_INTERVAL, 1000001, SAMPLE_INTERVAL), 1):
+        for _ in range(SAMPLE_INTERVAL):
+            func()
+        after = get_rss()
+        out.write(f'[{name}, iter: {n:09}, RSS: {after:010}]\n')
+        if after != before:
+            out.write(
+                f'{name}: RSS changed from {before} to {after} '
+                f'after {n} iters\n')
+        if sample % FLUSH_INTERVAL == 0:
+            out.flush()
+        before = after
 
 
 def main():
-    warmup_count = 0
-    for n in range(1000000):
-        if n % 1000 == 0:
-            print(f'[iter: {n:09}, RSS: {get_rss():010}]')
-        if n > warmup_count:
-            before = get_rss()
-        serialize_and_cleanup()
-        if n > warmup_count:
-            after = get_rss()
-            if after != before:
-                msg = f'RSS changed from {before} to {after} after {n} iters'
-                print(msg)
+    out = sys.stdout
+    # `Buffer.dataframe()` memory is managed natively: Cyclic GC passes would
+    # only add noise to the measurements (and slow down the loop).
+    gc.disable()
+    try:
+        # Separate phases, so each one's RSS samples are its own.
+        check_leaks('new buffer', serialize_and_cleanup, out)
+        check_leaks('reused buffer', serialize_reused, out)
+    finally:
+        out.flush()
+        gc.enable()
 
 
 if __name__ == '__main__':
     main()
-    
\ No newline at end of file